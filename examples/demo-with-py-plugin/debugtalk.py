@@ -1,3 +1,4 @@
+import builtins
 import logging
 import time
 from typing import List
@@ -17,17 +18,11 @@ def sleep(n_secs):
 
 
 def sum(*args):
-    result = 0
-    for arg in args:
-        result += arg
-    return result
+    return builtins.sum(args)
 
 
 def sum_ints(*args: List[int]) -> int:
-    result = 0
-    for arg in args:
-        result += arg
-    return result
+    return builtins.sum(args)
 
 
 def sum_two_int(a: int, b: int) -> int:
@@ -39,17 +34,11 @@ def sum_two_string(a: str, b: str) -> str:
 
 
 def sum_strings(*args: List[str]) -> str:
-    result = ""
-    for arg in args:
-        result += arg
-    return result
+    return "".join(args)
 
 
 def concatenate(*args: List[str]) -> str:
-    result = ""
-    for arg in args:
-        result += str(arg)
-    return result
+    return "".join(map(str, args))
 
 
 def setup_hook_example(name):
@@ -2,6 +2,7 @@ package builtin
 
 import (
 	"bytes"
+	"container/list"
 	"crypto/hmac"
 	"crypto/sha256"
 	"encoding/binary"
@@ -15,6 +16,7 @@ import (
 	"reflect"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/pkg/errors"
@@ -325,13 +327,87 @@ func loadFromCSV(path string) []map[string]interface{} {
 	return result
 }
 
+const maxMessageCacheSize = 128
+
+type messageCacheEntry struct {
+	path    string
+	modTime time.Time
+	size    int64
+	message []byte
+}
+
+// messageCache caches message files loaded by load_ws_message in LRU order,
+// an entry is reused only if the file modification time and size are unchanged
+var messageCache = struct {
+	sync.Mutex
+	entries map[string]*list.Element
+	lru     *list.List
+}{
+	entries: make(map[string]*list.Element),
+	lru:     list.New(),
+}
+
+func getCachedMessage(path string, info os.FileInfo) ([]byte, bool) {
+	messageCache.Lock()
+	defer messageCache.Unlock()
+	elem, ok := messageCache.entries[path]
+	if !ok {
+		return nil, false
+	}
+	entry := elem.Value.(*messageCacheEntry)
+	if !entry.modTime.Equal(info.ModTime()) || entry.size != info.Size() {
+		return nil, false
+	}
+	messageCache.lru.MoveToFront(elem)
+	return entry.message, true
+}
+
+func setCachedMessage(path string, info os.FileInfo, message []byte) {
+	messageCache.Lock()
+	defer messageCache.Unlock()
+	entry := &messageCacheEntry{
+		path:    path,
+		modTime: info.ModTime(),
+		size:    info.Size(),
+		message: message,
+	}
+	if elem, ok := messageCache.entries[path]; ok {
+		elem.Value = entry
+		messageCache.lru.MoveToFront(elem)
+		return
+	}
+	messageCache.entries[path] = messageCache.lru.PushFront(entry)
+	if messageCache.lru.Len() > maxMessageCacheSize {
+		oldest := messageCache.lru.Back()
+		messageCache.lru.Remove(oldest)
+		delete(messageCache.entries, oldest.Value.(*messageCacheEntry).path)
+	}
+}
+
+// loadMessage loads message file content for load_ws_message.
+// NOTICE: the returned bytes are shared by all callers loading the same file, do not modify them.
 func loadMessage(path string) []byte {
+	var info os.FileInfo
+	absPath, err := filepath.Abs(path)
+	if err == nil {
+		// info is nil if file stat failed, ReadFile will report the error
+		info, _ = os.Stat(absPath)
+	}
+	if info != nil {
+		if message, ok := getCachedMessage(absPath, info); ok {
+			return message
+		}
+	}
+
 	log.Info().Str("path", path).Msg("load message file")
 	file, err := ReadFile(path)
 	if err != nil {
 		log.Error().Err(err).Msg("read message file failed")
 		os.Exit(code.GetErrorCode(err))
 	}
+	if info != nil {
+		setCachedMessage(absPath, info, file)
+	}
 	return file
 }
 
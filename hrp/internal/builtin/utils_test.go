@@ -0,0 +1,62 @@
+package builtin
+
+import (
+	"fmt"
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestLoadMessageCache(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "message.txt")
+	modTime := time.Now().Add(-time.Hour).Truncate(time.Second)
+	writeMessage := func(content string, modTime time.Time) {
+		if !assert.Nil(t, os.WriteFile(path, []byte(content), 0o644)) {
+			t.Fatal()
+		}
+		if !assert.Nil(t, os.Chtimes(path, modTime, modTime)) {
+			t.Fatal()
+		}
+	}
+
+	writeMessage("hello", modTime)
+	if !assert.Equal(t, []byte("hello"), loadMessage(path)) {
+		t.Fatal()
+	}
+
+	// same modification time and size, cached message is returned
+	writeMessage("world", modTime)
+	if !assert.Equal(t, []byte("hello"), loadMessage(path)) {
+		t.Fatal()
+	}
+
+	// file changed on disk, message is reloaded
+	writeMessage("world", modTime.Add(time.Second))
+	if !assert.Equal(t, []byte("world"), loadMessage(path)) {
+		t.Fatal()
+	}
+	writeMessage("hello world", modTime.Add(time.Second))
+	if !assert.Equal(t, []byte("hello world"), loadMessage(path)) {
+		t.Fatal()
+	}
+}
+
+func TestLoadMessageCacheSize(t *testing.T) {
+	dir := t.TempDir()
+	for i := 0; i < maxMessageCacheSize+10; i++ {
+		path := filepath.Join(dir, fmt.Sprintf("message_%d.txt", i))
+		if !assert.Nil(t, os.WriteFile(path, []byte("message"), 0o644)) {
+			t.Fatal()
+		}
+		loadMessage(path)
+	}
+	if !assert.Equal(t, maxMessageCacheSize, messageCache.lru.Len()) {
+		t.Fatal()
+	}
+	if !assert.Equal(t, maxMessageCacheSize, len(messageCache.entries)) {
+		t.Fatal()
+	}
+}
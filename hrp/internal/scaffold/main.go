@@ -37,6 +37,17 @@ type ProjectInfo struct {
 //go:embed templates/*
 var templatesDir embed.FS
 
+// funpluginTestcases lists testcase templates and their file names in a funplugin scaffold project
+var funpluginTestcases = []struct {
+	templateFile string
+	targetFile   string
+}{
+	{"templates/testcases/demo_with_funplugin.json", "demo.json"},
+	{"templates/testcases/demo_requests.json", "requests.json"},
+	{"templates/testcases/demo_requests.yml", "requests.yml"},
+	{"templates/testcases/demo_ref_testcase.yml", "ref_testcase.yml"},
+}
+
 // CopyFile copies a file from templates dir to scaffold project
 func CopyFile(templateFile, targetFile string) error {
 	log.Info().Str("path", targetFile).Msg("create file")
@@ -147,25 +158,12 @@ func CreateScaffold(projectName string, pluginType PluginType, venv string, forc
 	}
 
 	// create project with funplugin
-	err = CopyFile("templates/testcases/demo_with_funplugin.json",
-		filepath.Join(projectName, "testcases", "demo.json"))
-	if err != nil {
-		return err
-	}
-	err = CopyFile("templates/testcases/demo_requests.json",
-		filepath.Join(projectName, "testcases", "requests.json"))
-	if err != nil {
-		return err
-	}
-	err = CopyFile("templates/testcases/demo_requests.yml",
-		filepath.Join(projectName, "testcases", "requests.yml"))
-	if err != nil {
-		return err
-	}
-	err = CopyFile("templates/testcases/demo_ref_testcase.yml",
-		filepath.Join(projectName, "testcases", "ref_testcase.yml"))
-	if err != nil {
-		return err
+	for _, testcase := range funpluginTestcases {
+		err = CopyFile(testcase.templateFile,
+			filepath.Join(projectName, "testcases", testcase.targetFile))
+		if err != nil {
+			return err
+		}
 	}
 
 	// create debugtalk function plugin
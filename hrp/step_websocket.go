@@ -3,6 +3,7 @@ package hrp
 import (
 	"bytes"
 	"fmt"
+	"io"
 	"net/http"
 	"testing"
 	"time"
@@ -578,7 +579,7 @@ func writeWithType(c *websocket.Conn, step *TStep, messageType int, message inte
 	case []byte:
 		return writeWithAction(c, step, messageType, msg)
 	case string:
-		return writeWithAction(c, step, messageType, []byte(msg))
+		return writeWithAction(c, step, messageType, msg)
 	case bytes.Buffer:
 		return writeWithAction(c, step, messageType, msg.Bytes())
 	default:
@@ -587,16 +588,42 @@ func writeWithType(c *websocket.Conn, step *TStep, messageType int, message inte
 	}
 }
 
-func writeWithAction(c *websocket.Conn, step *TStep, messageType int, message []byte) error {
+// writeWithAction writes message according to the step action, message should be []byte or string
+func writeWithAction(c *websocket.Conn, step *TStep, messageType int, message interface{}) error {
 	switch step.WebSocket.Type {
 	case wsPing:
-		return c.WriteControl(websocket.PingMessage, message, time.Now().Add(defaultWriteWait))
+		return c.WriteControl(websocket.PingMessage, messageBytes(message), time.Now().Add(defaultWriteWait))
 	case wsClose:
-		closeMessage := websocket.FormatCloseMessage(int(step.WebSocket.GetCloseStatusCode()), string(message))
+		closeMessage := websocket.FormatCloseMessage(int(step.WebSocket.GetCloseStatusCode()), string(messageBytes(message)))
 		return c.WriteControl(websocket.CloseMessage, closeMessage, time.Now().Add(defaultWriteWait))
 	default:
-		return c.WriteMessage(messageType, message)
+		return writeData(c, messageType, message)
+	}
+}
+
+func messageBytes(message interface{}) []byte {
+	if msg, ok := message.(string); ok {
+		return []byte(msg)
+	}
+	msg, _ := message.([]byte)
+	return msg
+}
+
+// writeData writes a text or binary data message, strings are written into the frame directly
+// without converting to []byte first
+func writeData(c *websocket.Conn, messageType int, message interface{}) error {
+	msg, ok := message.(string)
+	if !ok {
+		return c.WriteMessage(messageType, messageBytes(message))
+	}
+	w, err := c.NextWriter(messageType)
+	if err != nil {
+		return err
+	}
+	if _, err = io.WriteString(w, msg); err != nil {
+		return err
 	}
+	return w.Close()
 }
 
 func closeWithTimeout(urlString string, r *SessionRunner, step *TStep, stepVariables map[string]interface{}) (*wsCloseRespObject, error) {
@@ -624,8 +651,8 @@ func closeWithTimeout(urlString string, r *SessionRunner, step *TStep, stepVaria
 					Msg("discard redundant message")
 				continue
 			}
-			if e, ok := readErr.(*websocket.CloseError); !ok {
-				errorChan <- errors.Wrap(e, "read message failed")
+			if _, ok := readErr.(*websocket.CloseError); !ok {
+				errorChan <- errors.Wrap(readErr, "read message failed")
 				return
 			}
 		}
@@ -1,8 +1,13 @@
 package tests
 
 import (
+	"net/http"
+	"net/http/httptest"
+	"strings"
 	"testing"
 
+	"github.com/gorilla/websocket"
+
 	"github.com/httprunner/httprunner/v4/hrp"
 )
 
@@ -264,3 +269,69 @@ func TestWebSocketProtocolUsingBaseURL(t *testing.T) {
 		t.Fatalf("run testcase error: %v", err)
 	}
 }
+
+func TestWebSocketTextMessage(t *testing.T) {
+	// local echo server, replies text messages as they are
+	upgrader := websocket.Upgrader{}
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		conn, err := upgrader.Upgrade(w, r, nil)
+		if err != nil {
+			return
+		}
+		defer conn.Close()
+		for {
+			messageType, message, err := conn.ReadMessage()
+			if err != nil {
+				return
+			}
+			if messageType != websocket.TextMessage {
+				message = []byte("unexpected message type")
+			}
+			if err := conn.WriteMessage(websocket.TextMessage, message); err != nil {
+				return
+			}
+		}
+	}))
+	defer server.Close()
+
+	testcase := &hrp.TestCase{
+		Config: hrp.NewConfig("run websocket request with text message").
+			WithVariables(map[string]interface{}{
+				"wsURL": "ws://" + strings.TrimPrefix(server.URL, "http://"),
+				"text":  "hello websocket",
+			}),
+		TestSteps: []hrp.IStep{
+			hrp.NewStep("open connection").
+				WebSocket().
+				OpenConnection("$wsURL").
+				Validate().
+				AssertEqual("status_code", 101, "check open status code"),
+			hrp.NewStep("write and read string").
+				WebSocket().
+				WriteAndRead("$wsURL").
+				WithTextMessage("$text").
+				Validate().
+				AssertEqual("body", "hello websocket", "check text message"),
+			hrp.NewStep("write string and read").
+				WebSocket().
+				Write("$wsURL").
+				WithTextMessage("have a nice day!"),
+			hrp.NewStep("read string").
+				WebSocket().
+				Read("$wsURL").
+				Validate().
+				AssertEqual("body", "have a nice day!", "check text message"),
+			hrp.NewStep("close connection with string reason").
+				WebSocket().
+				CloseConnection("$wsURL").
+				WithTextMessage("bye").
+				WithCloseStatus(1000).
+				Validate().
+				AssertEqual("status_code", 1000, "check close status code"),
+		},
+	}
+	err := hrp.NewRunner(t).Run(testcase)
+	if err != nil {
+		t.Fatalf("run testcase error: %v", err)
+	}
+}
@@ -9,12 +9,12 @@ import time
 
 from httprunner.exceptions import ParamsError
 
+RANDOM_STRING_CHARS = string.ascii_letters + string.digits
+
 
 def gen_random_string(str_len):
     """generate random string with specified length"""
-    return "".join(
-        random.choice(string.ascii_letters + string.digits) for _ in range(str_len)
-    )
+    return "".join(random.choices(RANDOM_STRING_CHARS, k=str_len))
 
 
 def get_timestamp(str_len=13):
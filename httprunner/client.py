@@ -1,5 +1,7 @@
 import json
+import re
 import time
+from typing import Any
 
 import requests
 import urllib3
@@ -18,6 +20,10 @@ from httprunner.utils import lower_dict_keys, omit_long_data
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# a JSON document starts with one of these characters after optional whitespaces,
+# including NaN, Infinity and -Infinity accepted by json.loads
+JSON_HEAD_REGEX = re.compile(r'\s*[{\["\-0-9tfnNI]')
+
 
 class ApiResponse(Response):
     def raise_for_status(self):
@@ -26,6 +32,29 @@ class ApiResponse(Response):
         Response.raise_for_status(self)
 
 
+def load_json_body(body: Any) -> Any:
+    """load body as json if possible, otherwise return body as it is.
+    str bodies that cannot be json are detected by the first character,
+    so that json.loads is not called on them. bytes bodies are always
+    passed to json.loads, which detects UTF-8 BOM, UTF-16 and UTF-32.
+    """
+    if isinstance(body, str):
+        if not JSON_HEAD_REGEX.match(body):
+            # str: a=1&b=2
+            return body
+    elif not isinstance(body, (bytes, bytearray)):
+        # neither str nor bytes/bytearray, e.g. <MultipartEncoder>
+        return body
+
+    try:
+        return json.loads(body)
+    except json.JSONDecodeError:
+        return body
+    except UnicodeDecodeError:
+        # bytes/bytearray: request body in protobuf
+        return body
+
+
 def get_req_resp_record(resp_obj: Response) -> ReqRespData:
     """get request and response info from Response() object."""
 
@@ -44,17 +73,7 @@ def get_req_resp_record(resp_obj: Response) -> ReqRespData:
 
     request_body = resp_obj.request.body
     if request_body is not None:
-        try:
-            request_body = json.loads(request_body)
-        except json.JSONDecodeError:
-            # str: a=1&b=2
-            pass
-        except UnicodeDecodeError:
-            # bytes/bytearray: request body in protobuf
-            pass
-        except TypeError:
-            # neither str nor bytes/bytearray, e.g. <MultipartEncoder>
-            pass
+        request_body = load_json_body(request_body)
 
         request_content_type = lower_dict_keys(request_headers).get("content-type")
         if request_content_type and "multipart/form-data" in request_content_type:
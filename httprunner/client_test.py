@@ -1,6 +1,7 @@
+import math
 import unittest
 
-from httprunner.client import HttpSession
+from httprunner.client import HttpSession, load_json_body
 from httprunner.utils import HTTP_BIN_URL
 
 
@@ -71,3 +72,24 @@ class TestHttpSession(unittest.TestCase):
         self.assertEqual(address.server_port, 0)
         self.assertEqual(address.client_ip, "N/A")
         self.assertEqual(address.client_port, 0)
+
+
+class TestLoadJsonBody(unittest.TestCase):
+    def test_load_json_body(self):
+        self.assertEqual(load_json_body('{"a": 1}'), {"a": 1})
+        self.assertEqual(load_json_body(b' [1, "2"]'), [1, "2"])
+        self.assertEqual(load_json_body(b"123"), 123)
+        self.assertEqual(load_json_body("a=1&b=2"), "a=1&b=2")
+        self.assertEqual(load_json_body("{a=1"), "{a=1")
+        self.assertEqual(load_json_body(b"\x08\x96\x01"), b"\x08\x96\x01")
+        self.assertEqual(load_json_body(b"1\xff\xfe"), b"1\xff\xfe")
+        self.assertEqual(load_json_body(b'\xef\xbb\xbf{"a":1}'), {"a": 1})
+        self.assertEqual(load_json_body('{"a":1}'.encode("utf-16")), {"a": 1})
+        self.assertEqual(load_json_body('{"a":1}'.encode("utf-32")), {"a": 1})
+        self.assertEqual(load_json_body('{"a":1}'.encode("utf-16-le")), {"a": 1})
+        self.assertTrue(math.isnan(load_json_body("NaN")))
+        self.assertEqual(load_json_body("Infinity"), math.inf)
+        self.assertEqual(load_json_body("-Infinity"), -math.inf)
+        self.assertTrue(math.isnan(load_json_body(b"NaN")))
+        body = object()
+        self.assertIs(load_json_body(body), body)
@@ -106,7 +106,7 @@ def _convert_validators(validators: List) -> List:
 
         elif len(v) == 1:
             # format2: {'eq': ['status_code', 201]}
-            comparator = list(v.keys())[0]
+            comparator = next(iter(v))
             v[comparator][0] = _convert_jmespath(v[comparator][0])
 
     return validators
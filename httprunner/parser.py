@@ -433,10 +433,24 @@ def parse_data(
         return raw_data
 
 
+def is_literal_value(value: Any) -> bool:
+    """check if value will be returned as it is by parse_data,
+    e.g. numbers, booleans, None, strings without $ or surrounding whitespaces
+    """
+    if isinstance(value, str):
+        return "$" not in value and value == value.strip(" \t")
+
+    return not isinstance(value, (list, set, tuple, dict))
+
+
 def parse_variables_mapping(
     variables_mapping: VariablesMapping, functions_mapping: FunctionsMapping = None
 ) -> VariablesMapping:
 
+    # no variable or function reference, skip parsing
+    if all(is_literal_value(value) for value in variables_mapping.values()):
+        return dict(variables_mapping)
+
     parsed_variables: VariablesMapping = {}
 
     while len(parsed_variables) != len(variables_mapping):
@@ -39,6 +39,16 @@ class TestParserBasic(unittest.TestCase):
         self.assertEqual(parsed_variables["varA"], "123")
         self.assertEqual(parsed_variables["varB"], "123")
 
+    def test_parse_variables_mapping_literal(self):
+        variables = {"varA": "abc", "varB": 1.2, "varC": None, "varD": True}
+        parsed_variables = parser.parse_variables_mapping(variables)
+        self.assertEqual(parsed_variables, variables)
+        self.assertIsNot(parsed_variables, variables)
+
+        variables = {"varA": " abc\t", "varB": ("a", 1)}
+        parsed_variables = parser.parse_variables_mapping(variables)
+        self.assertEqual(parsed_variables, {"varA": "abc", "varB": ["a", 1]})
+
     def test_parse_variables_mapping_exception(self):
         variables = {"varA": "$varB", "varB": "$varC", "a": 1, "b": 2}
         with self.assertRaises(VariableNotFound):
@@ -92,8 +92,7 @@ def uniform_validator(validator):
 
     elif len(validator) == 1:
         # format2
-        comparator = list(validator.keys())[0]
-        compare_values = validator[comparator]
+        comparator, compare_values = next(iter(validator.items()))
 
         if not isinstance(compare_values, list) or len(compare_values) not in [2, 3]:
             raise ParamsError(f"invalid validator: {validator}")
@@ -281,7 +280,7 @@ class ResponseObject(ResponseObjectBase):
             "cookies": self.cookies,
             "body": self.body,
         }
-        if not expr.startswith(tuple(resp_obj_meta.keys())):
+        if not expr.startswith(tuple(resp_obj_meta)):
             if hasattr(self.resp_obj,expr):
                 return getattr(self.resp_obj,expr)
             else:
@@ -39,6 +39,7 @@ class SessionRunner(object):
     case_id: Text = ""
     root_dir: Text = ""
     thrift_client = None
+    close_thrift_client_on_exit: bool = False
     db_engine = None
 
     __config: TConfig
@@ -239,6 +240,14 @@ class SessionRunner(object):
                     attachment_type=ALLURE.attachment_type.TEXT,
                 )
 
+            if self.close_thrift_client_on_exit:
+                try:
+                    self.thrift_client.close()
+                except Exception as ex:
+                    logger.warning(f"close thrift client failed: {ex}")
+                self.thrift_client = None
+                self.close_thrift_client_on_exit = False
+
         self.__duration = time.time() - self.__start_at
         return self
 
@@ -0,0 +1,66 @@
+import unittest
+
+from httprunner import Config, HttpRunner
+from httprunner.models import StepResult
+
+
+class StubThriftClient(object):
+    def __init__(self, close_error: Exception = None):
+        self.close_count = 0
+        self.close_error = close_error
+
+    def close(self):
+        self.close_count += 1
+        if self.close_error:
+            raise self.close_error
+
+
+class StubThriftStep(object):
+    """mock thrift step, create thrift client if runner has none"""
+
+    retry_times = 0
+    retry_interval = 0
+
+    def __init__(self, thrift_client: StubThriftClient):
+        self.thrift_client = thrift_client
+
+    def name(self) -> str:
+        return "stub thrift step"
+
+    def run(self, runner: HttpRunner) -> StepResult:
+        if not runner.thrift_client:
+            runner.thrift_client = self.thrift_client
+            runner.close_thrift_client_on_exit = True
+        return StepResult(name=self.name(), success=True)
+
+
+class TestThriftClientLifecycle(unittest.TestCase):
+    def make_runner(self, thrift_client: StubThriftClient) -> HttpRunner:
+        class TestCaseThriftStub(HttpRunner):
+            config = Config("stub thrift testcase")
+            teststeps = [
+                StubThriftStep(thrift_client),
+                StubThriftStep(thrift_client),
+            ]
+
+        return TestCaseThriftStub()
+
+    def test_close_created_thrift_client(self):
+        thrift_client = StubThriftClient()
+        runner = self.make_runner(thrift_client).test_start()
+        self.assertEqual(thrift_client.close_count, 1)
+        self.assertIsNone(runner.thrift_client)
+        self.assertFalse(runner.close_thrift_client_on_exit)
+
+    def test_keep_passed_in_thrift_client(self):
+        thrift_client = StubThriftClient()
+        runner = self.make_runner(StubThriftClient())
+        runner.with_thrift_client(thrift_client).test_start()
+        self.assertEqual(thrift_client.close_count, 0)
+        self.assertIs(runner.thrift_client, thrift_client)
+
+    def test_close_thrift_client_failed(self):
+        thrift_client = StubThriftClient(close_error=OSError("socket closed"))
+        runner = self.make_runner(thrift_client).test_start()
+        self.assertEqual(thrift_client.close_count, 1)
+        self.assertIsNone(runner.thrift_client)
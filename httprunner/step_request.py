@@ -1,6 +1,6 @@
 import json
 import time
-from typing import Any, Dict, List, Text, Union
+from typing import Any, Callable, Dict, List, Text, Union
 
 import requests
 from loguru import logger
@@ -77,6 +77,40 @@ def pretty_format(v) -> str:
     return repr(utils.omit_long_data(v))
 
 
+def format_request_details(url: Text, method: Text, request_dict: Dict) -> Text:
+    lines = ["====== request details ======", f"url: {url}", f"method: {method}"]
+    lines.extend(f"{k}: {pretty_format(v)}" for k, v in request_dict.items())
+    return "\n".join(lines) + "\n"
+
+
+def format_response_details(resp: requests.Response) -> Text:
+    try:
+        resp_body = resp.json()
+    except (requests.exceptions.JSONDecodeError, json.decoder.JSONDecodeError):
+        resp_body = resp.content
+
+    lines = [
+        "====== response details ======",
+        f"status_code: {resp.status_code}",
+        f"headers: {pretty_format(resp.headers)}",
+        f"body: {pretty_format(resp_body)}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def log_details(format_details: Callable[[], Text], name: Text):
+    """log request/response details in debug mode and attach them to allure report.
+    details are only formatted when they will actually be logged or attached.
+    """
+    if ALLURE is None:
+        logger.opt(lazy=True).debug("{}", format_details)
+        return
+
+    details = format_details()
+    logger.debug(details)
+    ALLURE.attach(details, name=name, attachment_type=ALLURE.attachment_type.TEXT)
+
+
 def run_step_request(runner: HttpRunner, step: TStep) -> StepResult:
     """run teststep: request"""
     step_result = StepResult(
@@ -93,18 +127,24 @@ def run_step_request(runner: HttpRunner, step: TStep) -> StepResult:
     # parse variables
     step_variables = parse_variables_mapping(step_variables, functions)
 
-    request_dict = step.request.dict()
+    # shallow copy is enough, parse_data builds new containers while parsing
+    request_dict = dict(step.request)
     request_dict.pop("upload", None)
     parsed_request_dict = runner.parser.parse_data(request_dict, step_variables)
 
     request_headers = parsed_request_dict.pop("headers", {})
     # omit pseudo header names for HTTP/1, e.g. :authority, :method, :path, :scheme
-    request_headers = {
-        key: request_headers[key] for key in request_headers if not key.startswith(":")
-    }
+    if any(key.startswith(":") for key in request_headers):
+        request_headers = {
+            key: value
+            for key, value in request_headers.items()
+            if not key.startswith(":")
+        }
+    # last 6 digits of current timestamp in milliseconds
+    request_id_suffix = time.time_ns() // 1_000_000 % 1_000_000
     request_headers[
         "HRUN-Request-ID"
-    ] = f"HRUN-{runner.case_id}-{str(int(time.time() * 1000))[-6:]}"
+    ] = f"HRUN-{runner.case_id}-{request_id_suffix:06d}"
     parsed_request_dict["headers"] = request_headers
 
     step_variables["request"] = parsed_request_dict
@@ -122,39 +162,14 @@ def run_step_request(runner: HttpRunner, step: TStep) -> StepResult:
     parsed_request_dict["json"] = parsed_request_dict.pop("req_json", {})
 
     # log request
-    request_print = "====== request details ======\n"
-    request_print += f"url: {url}\n"
-    request_print += f"method: {method}\n"
-    for k, v in parsed_request_dict.items():
-        request_print += f"{k}: {pretty_format(v)}\n"
-
-    logger.debug(request_print)
-    if ALLURE is not None:
-        ALLURE.attach(
-            request_print,
-            name="request details",
-            attachment_type=ALLURE.attachment_type.TEXT,
-        )
+    log_details(
+        lambda: format_request_details(url, method, parsed_request_dict),
+        "request details",
+    )
     resp = runner.session.request(method, url, **parsed_request_dict)
 
     # log response
-    response_print = "====== response details ======\n"
-    response_print += f"status_code: {resp.status_code}\n"
-    response_print += f"headers: {pretty_format(resp.headers)}\n"
-
-    try:
-        resp_body = resp.json()
-    except (requests.exceptions.JSONDecodeError, json.decoder.JSONDecodeError):
-        resp_body = resp.content
-
-    response_print += f"body: {pretty_format(resp_body)}\n"
-    logger.debug(response_print)
-    if ALLURE is not None:
-        ALLURE.attach(
-            response_print,
-            name="response details",
-            attachment_type=ALLURE.attachment_type.TEXT,
-        )
+    log_details(lambda: format_response_details(resp), "response details")
     resp_obj = ResponseObject(resp, runner.parser)
     step_variables["response"] = resp_obj
 
@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-import platform
 import sys
 import time
 from typing import Text, Union
@@ -35,7 +34,7 @@ except ModuleNotFoundError:
 
 
 def ensure_thrift_ready():
-    assert platform.system() != "Windows", "Sorry,thrift not support Windows for now"
+    assert sys.platform != "win32", "Sorry,thrift not support Windows for now"
     if THRIFT_READY:
         return
 
@@ -118,6 +117,8 @@ def run_step_thrift_request(runner: HttpRunner, step: TStep) -> StepResult:
             proto_type=parsed_request_dict["proto_type"],
             trans_type=parsed_request_dict["trans_port"],
         )
+        # created by runner itself, close it when testcase finished
+        runner.close_thrift_client_on_exit = True
 
     # setup hooks
     if step.setup_hooks:
@@ -250,7 +250,7 @@ def json2thrift(json_str, thrift_class):
 def dumper(obj):
     try:
         return json.dumps(obj, default=lambda o: o.__dict__, sort_keys=True, indent=2)
-    except:
+    except (TypeError, ValueError, AttributeError):
         return obj.__dict__
 
 
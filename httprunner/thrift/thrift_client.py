@@ -135,5 +135,6 @@ class ThriftClient(object):
         logger.debug("thrift response = %s", response_obj)
         return thrift2dict(response_obj)
 
-    def __del__(self):
-        self.client.close()
+    def close(self):
+        if self.client is not None:
+            self.client.close()